@@ -7,20 +7,44 @@ import threading
 import uuid
 import logging
 import time
-from datetime import datetime, timedelta
 from typing import Optional, List, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 try:
     import paho.mqtt.client as mqtt
 except ImportError:
     mqtt = None
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from .devices import HomgarHome, MODEL_CODE_MAPPING, HomgarHubDevice
 from .logutil import TRACE, get_logger
 
 logger = get_logger(__file__)
 
+# These topics use the specific Aliyun hierarchy for your Hub and its Sub-devices
+_SUBSCRIBE_TOPIC_SUFFIXES = (
+    "thing/event/property/post",
+    "thing/service/property/set",
+    "thing/status/update",
+    "thing/event/+/post",
+    "thing/event/property/post_reply",
+    "thing/event/property/batch/post",
+    "thing/sub/status/update",
+    "thing/sub/event/property/post",
+    "thing/service/+/reply",
+)
+
+
+def _build_subscribe_topics(pk: str, dn: str) -> list:
+    """Returns the (topic, qos) list to subscribe to for a product key / device name pair."""
+    return [(f"/sys/{pk}/{dn}/{suffix}", 0) for suffix in _SUBSCRIBE_TOPIC_SUFFIXES]
+
 class HomgarApiException(Exception):
     def __init__(self, code, msg):
         super().__init__()
@@ -41,6 +65,15 @@ class HomgarApi:
             requests_session: requests.Session = None
     ):
         self.session = requests_session or requests.Session()
+        # Keep-alive pool so login/home/device/status polls reuse one connection
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"lang": "en", "appCode": "1", "Connection": "keep-alive"})
         self.cache = auth_cache or {}
         self.base = api_base_url
         self.mqtt_client = None
@@ -48,14 +81,20 @@ class HomgarApi:
         self.status_callbacks = []
         self.subscription_data = None
         self._mqtt_lock = threading.Lock()
+        self._mqtt_ready = threading.Event()
+        self._connecting = False
+        self._mqtt_connect_ok = False
+        self._mqtt_creds_cache = {}
+        self._subscribe_topics = []
+        self._sub_expire_ms = 0
         self._subscription_devices = []
         self._subscription_hids = []
         self._api_cmd_counter = 0
         self._mqtt_msg_counter = 0
 
     def _request(self, method, url, with_auth=True, headers=None, **kwargs):
-        # --- ORIGINAL LOGIC UNCHANGED ---
-        headers = {"lang": "en", "appCode": "1", **(headers or {})}
+        # lang/appCode are session defaults; only per-request headers are merged here
+        headers = dict(headers or {})
         if with_auth:
             headers["auth"] = self.cache.get("token")
         response = self.session.request(method, url, headers=headers, **kwargs)
@@ -78,7 +117,8 @@ class HomgarApi:
         return response
 
     def _request_json(self, method, path, **kwargs):
-        response = self._request(method, self.base + path, **kwargs).json()
+        # Decode the raw body directly; orjson takes bytes, skipping response.text
+        response = _json_loads(self._request(method, self.base + path, **kwargs).content)
         code = response.get('code')
         if code != 0:
             raise HomgarApiException(code, response.get('msg'))
@@ -103,7 +143,7 @@ class HomgarApi:
         }, with_auth=False)
         self.cache['email'] = email
         self.cache['token'] = data.get('token')
-        self.cache['token_expires'] = datetime.utcnow().timestamp() + data.get('tokenExpired')
+        self.cache['token_expires'] = time.time() + data.get('tokenExpired')
         self.cache['refresh_token'] = data.get('refreshToken')
 
     def get_homes(self) -> List[HomgarHome]:
@@ -143,11 +183,10 @@ class HomgarApi:
         return hubs
 
     def get_device_status(self, hub: HomgarHubDevice) -> None:
-        data = self._get_json("/app/device/getDeviceStatus", params={"mid": str(hub.mid)})
-        id_map = {sid: dev for dev in [hub, *hub.subdevices] for sid in dev.get_device_status_ids()}
-        for status in data.get('subDeviceStatus', []):
-            dev_id = status.get('id')
-            device = id_map.get(dev_id)
+        data = self._get_json("/app/device/getDeviceStatus", params={"mid": hub.mid_str})
+        id_map = hub.get_status_id_map()
+        for status in data.get('subDeviceStatus', ()):
+            device = id_map.get(status.get('id'))
             if device:
                 device.set_device_status(status)
 
@@ -156,13 +195,13 @@ class HomgarApi:
         seq = self._api_cmd_counter
         logger.info("MQTT-CMD: Outbound #%d | Zone %d | Mode %d", seq, port, mode)
         return self._post_json("/app/device/controlWorkMode", {
-            "deviceName": device_name, "productKey": product_key, "mid": str(mid),
+            "deviceName": device_name, "productKey": product_key, "mid": mid,
             "addr": addr, "port": port, "mode": mode, "duration": duration, "param": str(seq)
         })
 
     def ensure_logged_in(self, email: str, password: str, area_code: str = "31") -> None:
         exp = self.cache.get('token_expires', 0)
-        if self.cache.get('email') != email or (datetime.fromtimestamp(exp) - datetime.utcnow() < timedelta(minutes=60)):
+        if self.cache.get('email') != email or exp - time.time() < 3600:
             self.login(email, password, area_code)
 
     def subscribe_to_device_status(self, hid: str, hid_list: List[str], devices: List[dict]) -> Optional[dict]:
@@ -178,6 +217,10 @@ class HomgarApi:
         try:
             logger.info("Requesting MQTT credentials for HID: %s", hid)
             self.subscription_data = self._post_json("/app/device/subscribeStatus", sub_body)
+            self._subscribe_topics = _build_subscribe_topics(
+                self.subscription_data.get('productKey'), self.subscription_data.get('deviceName')
+            )
+            self._sub_expire_ms = int(self.subscription_data.get('expire', 0))
             #CONFIRM THE EXPIRATION TIME
             logger.info("[DIAG] [MQTT-EXPIRE] Raw Expire: %s", self.subscription_data.get('expire'))
             #
@@ -199,57 +242,74 @@ class HomgarApi:
         if callback and callback not in self.status_callbacks:
             self.status_callbacks.append(callback)
 
+        # One-shot connect: the first caller does the paho setup outside the lock,
+        # concurrent callers wait for it to finish instead of queueing on the lock
         with self._mqtt_lock:
             if self.mqtt_client and self.mqtt_connected: return True
-            try:
-                c = self.subscription_data
-                dn, pk, ds = c.get('deviceName'), c.get('productKey'), c.get('deviceSecret')
-                client_id = f"{dn}|securemode=3,signmethod=hmacsha1|"
-                username = f"{dn}&{pk}"
-                sign_content = f"clientId{dn}deviceName{dn}productKey{pk}"
-                password = hmac.new(ds.encode('utf-8'), sign_content.encode('utf-8'), hashlib.sha1).hexdigest().upper()
-
-                self.mqtt_client = mqtt.Client(client_id=client_id, clean_session=True, protocol=mqtt.MQTTv311)
-                self.mqtt_client.on_connect, self.mqtt_client.on_message = self._on_mqtt_connect, self._on_mqtt_message
-
-
-                # --- FIX 3: REMOVED self.mqtt_client.on_log to stop duplicate logs ---
-                self.mqtt_client.on_disconnect = self._on_mqtt_disconnect
-                # self.mqtt_client.on_log = self._on_mqtt_log  <-- COMMENT THIS OUT
-
-                self.mqtt_client.on_subscribe = self._on_mqtt_subscribe
-                
-                self.mqtt_client.username_pw_set(username, password)
-                self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=60)
-                
-                
-                h, p = c.get('mqttHostUrl').split(':') if ':' in c.get('mqttHostUrl') else (c.get('mqttHostUrl'), 1883)
-                logger.info("[DIAG] [MQTT-SIGN] Sending Signed Connect to %s", h)
-                self.mqtt_client.connect(h, int(p), keepalive=120)
-                self.mqtt_client.loop_start()
-                return True
-            except Exception as e:
-                logger.error("MQTT Connection Exception: %s", e)
-                return False
+            owner = not self._connecting
+            if owner:
+                self._connecting = True
+                self._mqtt_ready.clear()
+        if not owner:
+            return self._mqtt_ready.wait(timeout=10) and self._mqtt_connect_ok
+
+        self._mqtt_connect_ok = False
+        try:
+            c = self.subscription_data
+            client_id, username, password = self._build_mqtt_auth(
+                c.get('deviceName'), c.get('productKey'), c.get('deviceSecret')
+            )
+
+            self.mqtt_client = mqtt.Client(client_id=client_id, clean_session=True, protocol=mqtt.MQTTv311)
+            self.mqtt_client.on_connect, self.mqtt_client.on_message = self._on_mqtt_connect, self._on_mqtt_message
+
+
+            # --- FIX 3: REMOVED self.mqtt_client.on_log to stop duplicate logs ---
+            self.mqtt_client.on_disconnect = self._on_mqtt_disconnect
+            # self.mqtt_client.on_log = self._on_mqtt_log  <-- COMMENT THIS OUT
+
+            self.mqtt_client.on_subscribe = self._on_mqtt_subscribe
+            
+            self.mqtt_client.username_pw_set(username, password)
+            self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=60)
+            
+            
+            h, p = c.get('mqttHostUrl').split(':') if ':' in c.get('mqttHostUrl') else (c.get('mqttHostUrl'), 1883)
+            logger.info("[DIAG] [MQTT-SIGN] Sending Signed Connect to %s", h)
+            self.mqtt_client.connect(h, int(p), keepalive=120)
+            self.mqtt_client.loop_start()
+            self._mqtt_connect_ok = True
+            return True
+        except Exception as e:
+            logger.error("MQTT Connection Exception: %s", e)
+            return False
+        finally:
+            with self._mqtt_lock:
+                self._connecting = False
+            self._mqtt_ready.set()
+
+    def _build_mqtt_auth(self, dn: str, pk: str, ds: str) -> tuple:
+        """Returns the signed (client_id, username, password) triple, cached per credential set.
+
+        Renewals usually return the same dn/pk/ds, so the signature survives them; only the
+        latest credential set is kept, and the key includes ds, so new credentials always re-sign.
+        """
+        key = (dn, pk, ds)
+        auth = self._mqtt_creds_cache.get(key)
+        if auth is None:
+            self._mqtt_creds_cache.clear()
+            client_id = f"{dn}|securemode=3,signmethod=hmacsha1|"
+            username = f"{dn}&{pk}"
+            sign_content = f"clientId{dn}deviceName{dn}productKey{pk}"
+            password = hmac.new(ds.encode('utf-8'), sign_content.encode('utf-8'), hashlib.sha1).hexdigest().upper()
+            auth = self._mqtt_creds_cache[key] = (client_id, username, password)
+        return auth
+
     def _on_mqtt_connect(self, client, userdata, flags, rc):
         if rc == 0:
             self.mqtt_connected = True
-            pk = self.subscription_data.get('productKey')
-            dn = self.subscription_data.get('deviceName')
-            
-            # These topics use the specific Aliyun hierarchy for your Hub and its Sub-devices
-            topics = [
-                (f"/sys/{pk}/{dn}/thing/event/property/post", 0),
-                (f"/sys/{pk}/{dn}/thing/service/property/set", 0),
-                (f"/sys/{pk}/{dn}/thing/status/update", 0),
-                (f"/sys/{pk}/{dn}/thing/event/+/post", 0),
-                (f"/sys/{pk}/{dn}/thing/event/property/post_reply", 0),
-                (f"/sys/{pk}/{dn}/thing/event/property/batch/post", 0),
-                (f"/sys/{pk}/{dn}/thing/sub/status/update", 0),
-                (f"/sys/{pk}/{dn}/thing/sub/event/property/post", 0),
-                (f"/sys/{pk}/{dn}/thing/service/+/reply", 0)
-            ]
-            
+            # Built once per subscription in subscribe_to_device_status
+            topics = self._subscribe_topics
             client.subscribe(topics)
             logger.info("[DIAG] [MQTT-INTERNAL] Sending SUBSCRIBE %s", topics)
             logger.info("MQTT: SUCCESS - Connected. Listening for Hub/Sub-device commands and telemetry.")
@@ -259,7 +319,7 @@ class HomgarApi:
 
 
     def _on_mqtt_subscribe(self, client, userdata, mid, granted_qos):
-        logger.info("[DIAG] [MQTT-SUBACK] MessageID=%d | GrantedQoS=%s", mid, granted_qos)
+        logger.debug("[DIAG] [MQTT-SUBACK] MessageID=%d | GrantedQoS=%s", mid, granted_qos)
     
     def _on_mqtt_log(self, client, userdata, level, buf):
         logger.info("[DIAG] [MQTT-INTERNAL] %s", buf)
@@ -268,10 +328,11 @@ class HomgarApi:
         self._mqtt_msg_counter += 1
         seq = self._mqtt_msg_counter
         try:
-            payload = msg.payload.decode('utf-8')
-            logger.info("[DIAG] [MQTT-INTERNAL] Received PUBLISH (d0, q0, r0, m0), '%s', ...  (%d bytes)", msg.topic, len(payload))
-            logger.info("MQTT: Real-time update #%d received on topic: %s", seq, msg.topic)
-            data = json.loads(payload)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[DIAG] [MQTT-INTERNAL] Received PUBLISH (d0, q0, r0, m0), '%s', ...  (%d bytes)", msg.topic, len(msg.payload))
+                logger.debug("MQTT: Real-time update #%d received on topic: %s", seq, msg.topic)
+            # Both decoders accept the raw bytes, so no intermediate str is built
+            data = _json_loads(msg.payload)
             data['_seq'] = seq
             if 'params' in data: data.setdefault('data', data['params'])
             for cb in self.status_callbacks:
@@ -296,8 +357,14 @@ class HomgarApi:
 
     def is_subscription_expired(self) -> bool:
         if not self.subscription_data: return True
-        exp = self.subscription_data.get('expire', 0)
-        return (exp - int(time.time() * 1000)) <= 60000
+        # Renew 5 minutes early so the credentials never lapse mid-request
+        return self._sub_expire_ms - int(time.time() * 1000) <= 300_000
+
+    def renew_if_needed(self, callback: Optional[Callable] = None) -> bool:
+        """Checks expiry, renews the subscription and reconnects MQTT in one call."""
+        if not self.is_subscription_expired(): return True
+        if not self.renew_subscription(): return False
+        return self.connect_mqtt(callback)
 
     #def renew_subscription(self) -> bool:
     #    if not self.is_subscription_expired(): return True
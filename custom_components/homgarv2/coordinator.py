@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any, Optional
 
@@ -14,6 +15,19 @@ from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
+# While every hub pushes over MQTT the poll only checks topology (unchanged hubs skip the
+# status fetch), so it can run far less often
+MQTT_SCAN_INTERVAL = timedelta(minutes=5)
+# MQTT counts as live if a push arrived within this many seconds
+MQTT_FRESH_THRESHOLD = 120
+# Burst window (seconds) over which MQTT updates are merged into one listener refresh
+MQTT_FLUSH_DELAY = 0.05
+# Seconds between subscription renewal checks
+RENEWAL_CHECK_INTERVAL = 300
+
+def _topology_key(hub) -> tuple:
+    """Identifies a hub's layout, so an unchanged hub can keep its live device objects."""
+    return (type(hub), hub.name, tuple((type(dev), dev.mid, dev.address, dev.name) for dev in hub.subdevices))
 
 class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching HomGar data from API."""
@@ -33,6 +47,8 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=DOMAIN,
             # update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
             update_interval=SCAN_INTERVAL,
+            # Devices compare by state, so polls that change nothing don't fan out to entities
+            always_update=False,
         )
         self.api = api
         self.email = email
@@ -43,6 +59,15 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.mqtt_connected = False
         self.mqtt_subscribed = False
         self._subscription_check_task = None
+        # hub mid_str -> monotonic time of that hub's last applied MQTT push
+        self._last_push: dict[str, float] = {}
+        self._mid_index: dict[str, Any] = {}
+        # uid_prefix -> DeviceInfo shared by all entities of a device (see entity._device_info_for)
+        self.device_info_cache: dict[str, Any] = {}
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
+        self._dirty = False
+        # One lock per device so overlapping commands never reach the same timer at once
+        self._device_locks: dict[str, asyncio.Lock] = {}
         
         # DEBUG: Track total processed updates since restart to match API sequences
         self._processed_update_count = 0
@@ -57,19 +82,48 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             homes = await self.hass.async_add_executor_job(self.api.get_homes)
             self.homes = homes
 
+            # Fan the per-home and per-hub requests out over the executor so the
+            # cycle takes as long as the slowest request rather than their sum
+            hubs_per_home = await asyncio.gather(*(
+                self.hass.async_add_executor_job(self.api.get_devices_for_hid, home.hid)
+                for home in homes
+            ))
+            hubs = [hub for home_hubs in hubs_per_home for hub in home_hubs]
+
+            # get_devices_for_hid returns new, empty objects; keep the pushed-to objects of any
+            # hub that is itself pushing and whose topology is unchanged, and skip its status fetch
+            stale_hubs = []
+            for i, hub in enumerate(hubs):
+                current = self.devices.get(f"hub_{hub.mid}") if self._mqtt_is_fresh(hub.mid_str) else None
+                if current is not None and _topology_key(current) == _topology_key(hub):
+                    hubs[i] = current
+                else:
+                    stale_hubs.append(hub)
+            await asyncio.gather(*(
+                self.hass.async_add_executor_job(self.api.get_device_status, hub)
+                for hub in stale_hubs
+            ))
+
+            # MQTT already pushes status changes, so only poll for topology every few minutes
+            # once every hub is subscribed and pushing; any other hub needs the short HTTP poll
+            all_pushing = bool(hubs) and all(
+                getattr(hub, 'hub_product_key', None) and self._mqtt_is_fresh(hub.mid_str)
+                for hub in hubs
+            )
+            self.update_interval = MQTT_SCAN_INTERVAL if all_pushing else SCAN_INTERVAL
+
             devices = {}
-            for home in homes:
-                hubs = await self.hass.async_add_executor_job(
-                    self.api.get_devices_for_hid, home.hid
-                )
-                
-                for hub in hubs:
-                    await self.hass.async_add_executor_job(self.api.get_device_status, hub)
-                    devices[f"hub_{hub.mid}"] = hub
-                    for subdevice in hub.subdevices:
-                        devices[f"device_{subdevice.mid}_{subdevice.address}"] = subdevice
+            for hub in hubs:
+                devices[f"hub_{hub.mid}"] = hub
+                for subdevice in hub.subdevices:
+                    devices[f"device_{subdevice.mid}_{subdevice.address}"] = subdevice
 
             self.devices = devices
+            # First device per mid wins, matching the old linear scan (hubs precede their subdevices)
+            mid_index = {}
+            for dev in devices.values():
+                mid_index.setdefault(dev.mid_str, dev)
+            self._mid_index = mid_index
 
             # LINE 66: This ensures your 30s poll doesn't restart MQTT if it's already alive.
             if not self.api.mqtt_connected:
@@ -82,6 +136,16 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    def _mqtt_is_fresh(self, mid_str: str) -> bool:
+        """Return True if MQTT is connected, subscribed and this hub recently delivered a push."""
+        last_push = self._last_push.get(mid_str)
+        return (
+            last_push is not None
+            and self.api.mqtt_connected
+            and not self.api.is_subscription_expired()
+            and (time.monotonic() - last_push) < MQTT_FRESH_THRESHOLD
+        )
+
     async def _setup_mqtt_subscription(self) -> None:
         """Set up MQTT subscription for real-time device updates."""
         try:
@@ -96,7 +160,7 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     if device.hub_product_key:
                         devices_to_subscribe.append({
                             "deviceName": device.hub_device_name or f"MAC-{device.mid}",
-                            "mid": str(device.mid),
+                            "mid": device.mid_str,
                             "productKey": device.hub_product_key
                         })
                     
@@ -122,9 +186,15 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         seq = data.get('_seq', 'N/A')
         
         # DEBUG: Match this log to the [MQTT-IN #X] log in api.py
-        _LOGGER.info("[DEBUG] [COORDINATOR RECV #%d] Trace-Seq: %s | Data: %s", self._processed_update_count, seq, data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[COORDINATOR RECV #%d] Trace-Seq: %s | Data: %s", self._processed_update_count, seq, data)
         
-        self.hass.add_job(self._process_mqtt_update(data))
+        # Called on the paho thread: hand the payload straight to the event loop
+        self.hass.loop.call_soon_threadsafe(self._schedule_process, data)
+
+    def _schedule_process(self, data: dict) -> None:
+        """Schedule processing of an MQTT payload; runs on the event loop."""
+        self.hass.async_create_task(self._process_mqtt_update(data))
 
     async def _process_mqtt_update(self, data: dict) -> None:
         """Internal processor for MQTT data with deep state tracing to identify logic failures."""
@@ -135,32 +205,44 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not device_id:
                 return
                 
-            device = None
-            for dev_id, dev in self.devices.items():
-                if hasattr(dev, 'mid') and str(dev.mid) == str(device_id):
-                    device = dev
-                    break
+            # Every indexed entry is a HomgarDevice, so a hit is always updatable
+            device = self._mid_index.get(str(device_id))
                     
-            if device and hasattr(device, 'set_device_status'):
+            if device is not None:
                 status_payload = data.get('data')
                 
                 if isinstance(status_payload, dict):
+                    trace = _LOGGER.isEnabledFor(logging.DEBUG) and hasattr(device, 'zones')
                     # DEBUG: STATE TRACE - BEFORE DATA INJECTION
-                    if hasattr(device, 'zones'):
-                        _LOGGER.info("[DEBUG] [Proc-Trace #%s] PRE-UPDATE ZONES: %s", seq, device.zones)
+                    if trace:
+                        _LOGGER.debug("[Proc-Trace #%s] PRE-UPDATE ZONES: %s", seq, device.zones)
                     
-                    for s_id, s_val in status_payload.items():
-                        device.set_device_status({"id": s_id, "value": str(s_val)})
+                    # Hubs route sub-device IDs (Dnn) to their owner; only a push that
+                    # applied a status counts towards MQTT freshness
+                    if not device.set_device_status_bulk(status_payload):
+                        return
+                    self._last_push[device.mid_str] = time.monotonic()
 
                     # DEBUG: STATE TRACE - AFTER DATA INJECTION
-                    if hasattr(device, 'zones'):
-                        _LOGGER.info("[DEBUG] [Proc-Trace #%s] POST-UPDATE ZONES: %s", seq, device.zones)
+                    if trace:
+                        _LOGGER.debug("[Proc-Trace #%s] POST-UPDATE ZONES: %s", seq, device.zones)
                     
-                    self.async_set_updated_data(self.devices)
+                    self._dirty = True
+                    if self._pending_flush is None:
+                        self._pending_flush = self.hass.loop.call_later(MQTT_FLUSH_DELAY, self._flush_updates)
                 
         except Exception as err:
             _LOGGER.error("Error processing MQTT update: %s", err)
 
+    def _flush_updates(self) -> None:
+        """Notify listeners once for all MQTT updates received in the burst window."""
+        self._pending_flush = None
+        if self._dirty:
+            self._dirty = False
+            # Devices were updated in place on self.data; unlike async_set_updated_data
+            # this leaves the poll timer alone, so the fallback poll still fires
+            self.async_update_listeners()
+
     #def _start_subscription_renewal_task(self):
     #    """Starts the background task to check for token expiration."""
     #    if self._subscription_check_task:
@@ -180,11 +262,10 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Periodic loop to ensure MQTT connection stays alive."""
         while self.mqtt_connected:
             try:
-                await asyncio.sleep(300)
-                needs_renewal = await self.hass.async_add_executor_job(self.api.is_subscription_expired)
-                if needs_renewal:
-                    if await self.hass.async_add_executor_job(self.api.renew_subscription):
-                        await self.hass.async_add_executor_job(self.api.connect_mqtt, self._on_mqtt_status_update)
+                await asyncio.sleep(RENEWAL_CHECK_INTERVAL)
+                # Expiry check, renewal and reconnect share one executor job
+                if not await self.hass.async_add_executor_job(self.api.renew_if_needed, self._on_mqtt_status_update):
+                    _LOGGER.warning("MQTT subscription renewal failed, retrying in %ds", RENEWAL_CHECK_INTERVAL)
             except asyncio.CancelledError:
                 break
             except Exception as err:
@@ -196,8 +277,10 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         device = self.devices.get(device_id)
         if not device:
             return False
+        lock = self._device_locks.setdefault(device_id, asyncio.Lock())
         try:
-            return await self.hass.async_add_executor_job(device.control_zone, self.api, zone_number, mode, duration)
+            async with lock:
+                return await self.hass.async_add_executor_job(device.control_zone, self.api, zone_number, mode, duration)
         except Exception as err:
             _LOGGER.error("Error controlling zone: %s", err)
             return False
@@ -206,6 +289,9 @@ class HomgarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Graceful cleanup during integration reload or shutdown."""
         if self._subscription_check_task:
             self._subscription_check_task.cancel()
+        if self._pending_flush:
+            self._pending_flush.cancel()
+            self._pending_flush = None
         if self.mqtt_connected:
             await self.hass.async_add_executor_job(self.api.disconnect_mqtt)
             self.mqtt_connected = False
\ No newline at end of file
@@ -1,42 +1,123 @@
 import re
 import logging
-from typing import List, Optional
+import math
+import numbers
+from struct import Struct
+from types import MappingProxyType
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Constants for stats parsing
-STATS_VALUE_REGEX = re.compile(r'^(\d+)\((\d+)/(\d+)/(\d+)\)')
-
-def _parse_stats_value(s):
-    """Parses a HomGar-formatted stats string like '2931(2931/2931/2931)'."""
-    if match := STATS_VALUE_REGEX.fullmatch(s):
-        return int(match.group(1)), int(match.group(2)), int(match.group(3)), int(match.group(4))
-    else:
-        return None, None, None, None
-
-def _temp_to_mk(f):
-    """Convert Fahrenheit (integer * 10) to milli-Kelvin."""
-    try:
-        return round(1000 * ((int(f) * .1 - 32) * 5 / 9 + 273.15))
-    except (ValueError, TypeError):
+# Precompiled '10#<hex>' payload match for the per-packet hex parsers
+_HEX_PAYLOAD_RE = re.compile(r'10#([0-9A-Fa-f]+)')
+# Timer packets accept any '<prefix>#' and use the hex run up to the first non-hex character
+_TIMER_PAYLOAD_RE = re.compile(r'[^#]*#([0-9A-Fa-f]*)')
+# Byte markers preceding marker-located fields in the decoded payloads
+_MARK_AIR_HUM = 0x88
+_MARK_SOIL = 0xDC
+# Timer zones are encoded as <0x19..0x1C> 0xD8 <status byte>
+_MARK_ZONE_STATUS = 0xD8
+_ZONE_MARKER_BASE = 0x18
+# Zone status byte -> (status text, active flag)
+_ZONE_STATUS_MAP = {
+    0x41: ('on', True),
+    0x00: ('off_recent', False),
+    0x20: ('off_idle', False),
+}
+
+def _split_stats(s):
+    """Splits 'a(b/c/d)' into its four raw fields, or returns None if malformed."""
+    lp = s.find('(')
+    if lp <= 0 or s[-1] != ')':
         return None
-
-def _celsius_to_mk(c):
-    """Convert Celsius to milli-Kelvin."""
+    parts = s[lp + 1:-1].split('/')
+    if len(parts) != 3:
+        return None
+    return s[:lp], parts[0], parts[1], parts[2]
+
+def _parse_stats_first(s):
+    """Returns only the leading (current) value of a HomGar stats string like '2931(2931/2931/2931)'."""
+    fields = _split_stats(s)
+    # isdecimal() strings always convert, so int() cannot raise here
+    if fields and all(f.isdecimal() for f in fields):
+        return int(fields[0])
+    return None
+
+def _parse_int(val):
+    """Converts a number or signed decimal string the way int() would, or returns None if it can't."""
+    if isinstance(val, numbers.Integral):
+        return int(val)
+    if isinstance(val, float):
+        return int(val) if math.isfinite(val) else None
+    if isinstance(val, str):
+        raw = val.strip()
+        if (raw[1:] if raw[:1] in ('+', '-') else raw).isdecimal():
+            return int(raw)
+    return None
+
+def _hex_to_bytes(hex_part):
+    """Decodes a hex payload once, dropping a trailing unpaired nibble."""
+    return bytes.fromhex(hex_part[:len(hex_part) & ~1])
+
+def _f_tenths_to_c(f):
+    """Convert Fahrenheit (integer * 10) to Celsius."""
     try:
-        return round((float(c) + 273.15) * 1000)
+        # (f/10 - 32) * 5/9 == (f - 320) / 18: integer offset, then a single rounding division
+        return (int(f) - 320) / 18
     except (ValueError, TypeError):
         return None
 
+def _field_struct(plan):
+    """Compiles a _FIELD_PLAN (sorted by offset) into one Struct reading every uint16 field in a call."""
+    fmt, pos = '<', 0
+    for _, offset, _ in plan:
+        if offset < pos:
+            raise ValueError("field plan offsets must be ascending and non-overlapping")
+        if offset > pos:
+            fmt += f'{offset - pos}x'
+        fmt += 'H'
+        pos = offset + 2
+    return Struct(fmt)
+
+def _tenths(v):
+    """Scale a raw integer reading given in tenths."""
+    return v * 0.1
+
+# Model code -> device class, populated by @_register_model on each device class
+_MODEL_CODE_REGISTRY = {}
+MODEL_CODE_MAPPING = MappingProxyType(_MODEL_CODE_REGISTRY)
+
+def _register_model(cls):
+    """Class decorator registering a device class under each of its MODEL_CODES."""
+    for code in cls.MODEL_CODES:
+        _MODEL_CODE_REGISTRY[code] = cls
+    return cls
+
 class HomgarHome:
     """Represents a physical home containing multiple hubs."""
+    __slots__ = ('hid', 'name')
+
     def __init__(self, hid, name):
         self.hid = hid
         self.name = name
 
 class HomgarDevice:
     """Base class for all HomGar hardware entities."""
+    __slots__ = (
+        'model', 'model_code', 'name', 'did', 'mid', 'mid_str', 'alerts', 'address',
+        'rf_rssi', 'connection_state', '_status_d_id', '_status_ids', 'uid_prefix',
+        '_status_dispatch',
+    )
     FRIENDLY_DESC = "Unknown HomGar device"
+    # Number of switchable irrigation zones (0 = none); the switch platform builds one entity per zone
+    SUPPORTS_ZONES = 0
+    # Fixed-offset hex fields decoded by _apply_field_plan
+    _FIELD_PLAN = ()
+    _FIELD_STRUCT = _field_struct(_FIELD_PLAN)
+    # (state attribute key, device attribute) pairs exposed as entity extra state attributes
+    EXTRA_ATTRS = (('connected', 'connection_state'), ('rssi', 'rf_rssi'))
+    # Attributes compared by __eq__, so the coordinator can skip listener updates when nothing changed
+    _STATE_ATTRS = ('mid', 'address', 'name', 'model', 'rf_rssi', 'connection_state')
 
     def __init__(self, model, model_code, name, did, mid, alerts, **kwargs):
         self.model = model
@@ -44,119 +125,229 @@ class HomgarDevice:
         self.name = name
         self.did = did
         self.mid = mid
+        # String form sent in API/MQTT requests, coerced once
+        self.mid_str = str(mid)
         self.alerts = alerts
         self.address = None
         self.rf_rssi = None
         self.connection_state = None
+        # Set by subclasses once the address is known, so the hot path never re-formats it
+        self._status_d_id = None
+        self._status_ids = ()
+        # "<mid>_<address>" stem shared by the device identifier and all entity unique IDs
+        self.uid_prefix = None
+        # Status ID -> handler; subclasses may register additional IDs
+        self._status_dispatch = {"connected": self._parse_connected}
         
         if type(self) is HomgarDevice:
             logger.error("SYSTEM ALERT: Unknown device class instantiated. Name='%s', Model='%s'", self.name, self.model)
 
-    def get_device_status_ids(self) -> List[str]:
-        """Returns the list of ID strings the API uses for this specific device."""
-        return []
+    # Equality is a state comparison over _STATE_ATTRS; it exists so the coordinator's
+    # always_update=False can tell when a poll changed nothing. That state is mutable,
+    # so devices are deliberately unhashable.
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for a in self._STATE_ATTRS)
+
+    __hash__ = None
+
+    def get_device_status_ids(self) -> Tuple[str, ...]:
+        """Returns the ID strings the API uses for this specific device."""
+        return self._status_ids
+
+    def _assign_address(self, address) -> None:
+        """Sets the RF address along with the status ID and unique-ID stem derived from it."""
+        self.address = address
+        self._status_d_id = f"D{address:02d}"
+        self.uid_prefix = f"{self.mid}_{address}"
+        self._status_dispatch[self._status_d_id] = self._parse_status_d_value
 
     def set_device_status(self, api_obj: dict) -> None:
         """Entry point for applying API/MQTT status packets to this object."""
-        status_id = api_obj.get('id')
-        if status_id == f"D{self.address:02d}":
-            self._parse_status_d_value(api_obj.get('value', ''))
-        elif status_id == "connected":
-            try:
-                self.connection_state = (int(api_obj.get('value', 0)) == 1)
-            except:
-                pass
-
-    def _parse_status_d_value(self, val: str) -> None:
+        handler = self._status_dispatch.get(api_obj.get('id'))
+        if handler:
+            # A packet without a 'value' falls back to the handler's own default
+            if 'value' in api_obj:
+                handler(api_obj['value'])
+            else:
+                handler()
+
+    def set_device_status_bulk(self, status_payload: dict) -> bool:
+        """Applies a raw {status_id: value} mapping, e.g. an MQTT 'data' block, in one pass.
+
+        Returns True if any status ID was applied.
+        """
+        applied = False
+        for s_id, s_val in status_payload.items():
+            applied = self._apply_status(s_id, s_val) or applied
+        return applied
+
+    def _apply_status(self, s_id, s_val) -> bool:
+        """Applies one raw status value if this device handles the ID."""
+        handler = self._status_dispatch.get(s_id)
+        if handler is None:
+            return False
+        handler(s_val if isinstance(s_val, str) else str(s_val))
+        return True
+
+    def _parse_connected(self, val=0) -> None:
+        """Applies the 'connected' status flag (1 = online); a missing value counts as offline."""
+        # Number from HTTP polls or string from MQTT; None, empty or unparseable values
+        # leave the previous state alone
+        flag = _parse_int(val)
+        if flag is not None:
+            self.connection_state = (flag == 1)
+
+    def _parse_status_d_value(self, val: str = '') -> None:
         """Handles the complex semicolon-delimited status strings."""
         if not val:
             return
-        if ';' in val:
-            parts = val.split(';')
-            if len(parts) >= 2:
-                self._parse_general_status_d_value(parts[0])
-                self._parse_device_specific_status_d_value(parts[1])
+        head, sep, tail = val.partition(';')
+        if sep:
+            self._parse_general_status_d_value(head)
+            self._parse_device_specific_status_d_value(tail.partition(';')[0])
         else:
             self._parse_device_specific_status_d_value(val)
 
     def _parse_general_status_d_value(self, s: str):
         """Extracts common telemetry like RF RSSI (signal strength)."""
-        if ',' in s:
-            parts = s.split(',')
-            if len(parts) >= 2:
-                try:
-                    self.rf_rssi = int(parts[1])
-                except (ValueError, TypeError):
-                    pass
+        _, sep, rest = s.partition(',')
+        if sep:
+            rssi = _parse_int(rest.partition(',')[0])
+            if rssi is not None:
+                self.rf_rssi = rssi
 
     def _parse_device_specific_status_d_value(self, s: str):
         """Override this in specific device classes."""
         raise NotImplementedError()
+
+    def _apply_field_plan(self, buf: bytes) -> None:
+        """Decodes every _FIELD_PLAN field with the class's precompiled _FIELD_STRUCT.
+
+        A short frame still updates the fields it fully contains; the rest keep their last value.
+        """
+        if len(buf) >= self._FIELD_STRUCT.size:
+            for (attr, _, convert), raw in zip(self._FIELD_PLAN, self._FIELD_STRUCT.unpack_from(buf)):
+                setattr(self, attr, convert(raw))
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: short payload (%d bytes), applying partial update", self.name, len(buf))
+        for attr, offset, convert in self._FIELD_PLAN:
+            if offset + 2 <= len(buf):
+                setattr(self, attr, convert(buf[offset] | buf[offset + 1] << 8))
+
 class HomgarHubDevice(HomgarDevice):
     """The Gateway device (The Display Hub)."""
+    __slots__ = ('subdevices', 'hub_device_name', 'hub_product_key', '_status_id_map')
+    # Subdevices compare by their own state, so topology and sub-device changes both show up
+    _STATE_ATTRS = HomgarDevice._STATE_ATTRS + ('subdevices',)
     def __init__(self, subdevices, hub_device_name=None, hub_product_key=None, **kwargs):
         super().__init__(**kwargs)
-        self.address = 1
+        self._assign_address(1)
         self.subdevices = subdevices
         self.hub_device_name = hub_device_name
         self.hub_product_key = hub_product_key
+        self._status_id_map = None
+
+    def get_status_id_map(self) -> dict:
+        """Maps status IDs to the hub or sub-device they belong to.
+
+        Built once per hub: a topology change always yields new hub objects.
+        """
+        if self._status_id_map is None:
+            self._status_id_map = {sid: dev for dev in [self, *self.subdevices] for sid in dev.get_device_status_ids()}
+        return self._status_id_map
+
+    def set_device_status_bulk(self, status_payload: dict) -> bool:
+        """Applies a hub's MQTT 'data' block, routing sub-device IDs (e.g. 'D02') to their owner.
+
+        Sub-devices share the hub's mid, so their pushes arrive on the hub. IDs the hub
+        handles itself stay on the hub; the rest go through get_status_id_map, as in
+        get_device_status.
+        """
+        id_map = self.get_status_id_map()
+        applied = False
+        for s_id, s_val in status_payload.items():
+            if self._apply_status(s_id, s_val):
+                applied = True
+            else:
+                device = id_map.get(s_id)
+                if device is not None:
+                    applied = device._apply_status(s_id, s_val) or applied
+        return applied
 
     def _parse_device_specific_status_d_value(self, s):
         pass
 
 class HomgarSubDevice(HomgarDevice):
     """Devices that communicate through a Hub (RF/Bluetooth)."""
+    __slots__ = ('port_number',)
     def __init__(self, address, port_number, **kwargs):
         super().__init__(**kwargs)
-        self.address = address
+        self._assign_address(address)
+        self._status_ids = (self._status_d_id, "connected")
         self.port_number = port_number
 
-    def get_device_status_ids(self):
-        return [f"D{self.address:02d}", "connected"]
-
+@_register_model
 class RainPointAirSensor(HomgarSubDevice):
     """Outdoor/Indoor Air Sensor (HCS014ARF) with Min/Max/Current decoding."""
+    __slots__ = ('temp_c_current', 'temp_c_min', 'temp_c_max', 'hum_current', 'hum_min', 'hum_max')
     MODEL_CODES = [262]
+    _STATE_ATTRS = HomgarSubDevice._STATE_ATTRS + (
+        'temp_c_current', 'temp_c_min', 'temp_c_max', 'hum_current', 'hum_min', 'hum_max',
+    )
+    # (attribute, byte offset, converter): Fahrenheit*10 temperatures, e.g. 58 02 -> 15.6C
+    _FIELD_PLAN = (
+        ('temp_c_min', 1, _f_tenths_to_c),
+        ('temp_c_max', 3, _f_tenths_to_c),
+        ('temp_c_current', 10, _f_tenths_to_c),
+    )
+    _FIELD_STRUCT = _field_struct(_FIELD_PLAN)
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.temp_mk_current = None
-        self.temp_mk_min = None
-        self.temp_mk_max = None
+        self.temp_c_current = None
+        self.temp_c_min = None
+        self.temp_c_max = None
         self.hum_current = None
         self.hum_min = None
         self.hum_max = None
 
     def _parse_device_specific_status_d_value(self, s):
-        if "10#" in s:
-            hex_part = s.split('#')[1]
-            try:
-                # Little Endian Helper for Temperature
-                def parse_t(start):
-                    # Swaps bytes (e.g., '5802' -> '0258')
-                    flipped = hex_part[start+2:start+4] + hex_part[start:start+2]
-                    return _temp_to_mk(int(flipped, 16))
-
-                # TEMPERATURE MAPPING (Offsets 2, 6, 20)
-                self.temp_mk_min     = parse_t(2)  # Index 2-5: '5802' -> 15.6C
-                self.temp_mk_max     = parse_t(6)  # Index 6-9: '7502' -> 17.2C
-                self.temp_mk_current = parse_t(20) # Index 20-23: '6102' -> 16.1C
-
-                # HUMIDITY MAPPING (Offsets 26, 30, 32 based on marker 88)
-                pos_88 = hex_part.find('88')
-                if pos_88 >= 0:
-                    self.hum_current = int(hex_part[pos_88+2:pos_88+4], 16) # '33' -> 51%
-                    self.hum_min     = int(hex_part[pos_88+6:pos_88+8], 16) # '31' -> 49%
-                    self.hum_max     = int(hex_part[pos_88+8:pos_88+10], 16) # '38' -> 56%
-                
-                logger.info("[DEBUG] [AIR] %s: T(C:%s Min:%s Max:%s) H(C:%s Min:%s Max:%s)", 
-                            self.name, self.temp_mk_current, self.temp_mk_min, 
-                            self.temp_mk_max, self.hum_current, self.hum_min, self.hum_max)
-            except Exception as e:
-                logger.error("Air Sensor parse error: %s", e)
-
+        payload = _HEX_PAYLOAD_RE.match(s)
+        if payload is None:
+            return
+        hex_part = payload.group(1)
+        buf = _hex_to_bytes(hex_part)
+        # TEMPERATURE MAPPING (hex offsets 2, 6, 20 -> bytes 1, 3, 10)
+        self._apply_field_plan(buf)
+
+        # HUMIDITY MAPPING (bytes 1, 3, 4 after the 0x88 marker)
+        pos = buf.find(_MARK_AIR_HUM)
+        if 0 <= pos < len(buf) - 4:
+            self.hum_current = buf[pos + 1] # 0x33 -> 51%
+            self.hum_min     = buf[pos + 3] # 0x31 -> 49%
+            self.hum_max     = buf[pos + 4] # 0x38 -> 56%
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[AIR] %s: T(C:%s Min:%s Max:%s) H(C:%s Min:%s Max:%s)", 
+                         self.name, self.temp_c_current, self.temp_c_min, 
+                         self.temp_c_max, self.hum_current, self.hum_min, self.hum_max)
+
+@_register_model
 class RainPointRainSensor(HomgarSubDevice):
     """Outdoor Rain Sensor (HCS012ARF) with corrected offsets."""
+    __slots__ = ('rain_hour', 'rain_24h', 'rain_7d', 'rain_total')
     MODEL_CODES = [87]
+    _STATE_ATTRS = HomgarSubDevice._STATE_ATTRS + ('rain_hour', 'rain_24h', 'rain_7d', 'rain_total')
+    # (attribute, byte offset, converter): rainfall in tenths of a mm
+    _FIELD_PLAN = (
+        ('rain_hour', 5, _tenths),
+        ('rain_24h', 9, _tenths),
+        ('rain_7d', 13, _tenths),
+        ('rain_total', 18, _tenths),
+    )
+    _FIELD_STRUCT = _field_struct(_FIELD_PLAN)
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.rain_hour = 0.0
@@ -165,120 +356,135 @@ class RainPointRainSensor(HomgarSubDevice):
         self.rain_total = 0.0
 
     def _parse_device_specific_status_d_value(self, s):
-        if "10#" in s:
-            hex_part = s.split('#')[1]
-            # This line below is what prints the HEX to your logs
-            #logger.info("[DEBUG] Raw HEX received: %s", hex_part)
-            try:
-                # Little Endian Helper: Swaps bytes and divides by 10
-                def get_le_val(start):
-                    # We need 4 characters (2 bytes)
-                    flipped = hex_part[start+2:start+4] + hex_part[start:start+2]
-                    return int(flipped, 16) * 0.1
-
-                # Corrected Offsets based on your specific HEX:
-                # Index 2: 0000 (Hour) -> 0.0
-                # Index 10: 0000 (24h) -> 0.0
-                # Index 26: 1202 (7d/Total) -> 53.0
-                # Index 36: 1202 (Total/7d) -> 53.0
-                
-                self.rain_hour   = get_le_val(10)   # Hourly
-                self.rain_24h    = get_le_val(18)  # MOVED from 10 to 14
-                self.rain_7d     = get_le_val(26)  # 7-Day
-                self.rain_total  = get_le_val(36)  # MOVED from 36 to 38 for alignment
-
-                logger.info("[DEBUG] [RAIN] 1h:%.1f, 24h:%.1f, 7d:%.1f, Tot:%.1f", 
-                            self.rain_hour, self.rain_24h, self.rain_7d, self.rain_total)
-            except Exception as e:
-                logger.error("Rain Sensor parse error: %s", e)
+        payload = _HEX_PAYLOAD_RE.match(s)
+        if payload is None:
+            return
+        hex_part = payload.group(1)
+        # Hex offsets: 10 hourly, 18 24h, 26 7-day, 36 total (e.g. '1202' -> 53.0)
+        self._apply_field_plan(_hex_to_bytes(hex_part))
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[RAIN] 1h:%.1f, 24h:%.1f, 7d:%.1f, Tot:%.1f", 
+                         self.rain_hour, self.rain_24h, self.rain_7d, self.rain_total)
+
+@_register_model
 class RainPointSoilMoistureSensor(HomgarSubDevice):
     """Soil moisture and temperature sensor (HCS026FRF)."""
+    __slots__ = ('moist_percent_current', 'temp_c_current')
     MODEL_CODES = [317]
+    _STATE_ATTRS = HomgarSubDevice._STATE_ATTRS + ('moist_percent_current', 'temp_c_current')
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.moist_percent_current = None
-        self.temp_mk_current = None
+        self.temp_c_current = None
 
     def _parse_device_specific_status_d_value(self, s):
         if not s: return
-        if "10#" in s:
-            hex_part = s.split('#')[1]
-            pos = hex_part.find('DC')
-            if pos >= 0 and pos + 8 <= len(hex_part):
-                self.moist_percent_current = int(hex_part[pos+6:pos+8], 16)
-                logger.info("[DEBUG] [SENSOR UPDATE] %s: Moisture %d%%", self.name, self.moist_percent_current)
+        if s[:3] == "10#":
+            payload = _HEX_PAYLOAD_RE.match(s)
+            if payload is None:
+                return
+            buf = _hex_to_bytes(payload.group(1))
+            # Moisture is the third byte after the 0xDC marker
+            pos = buf.find(_MARK_SOIL)
+            if 0 <= pos < len(buf) - 3:
+                self.moist_percent_current = buf[pos + 3]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[SENSOR UPDATE] %s: Moisture %d%%", self.name, self.moist_percent_current)
             return
         if ',' in s:
             parts = s.split(',')
             if len(parts) >= 2:
-                self.temp_mk_current = _temp_to_mk(parts[0])
+                self.temp_c_current = _f_tenths_to_c(parts[0])
                 self.moist_percent_current = int(parts[1])
 
+@_register_model
 class HTV405FRF(HomgarSubDevice):
     """HTV405FRF 4-Zone Smart Water Timer."""
+    __slots__ = ('_zone_active', '_zone_status', 'hub_device_name', 'hub_product_key', 'hw_sequence')
     MODEL_CODES = [38]
+    _STATE_ATTRS = HomgarSubDevice._STATE_ATTRS + ('_zone_active', '_zone_status', 'hw_sequence')
     FRIENDLY_DESC = "HTV405FRF 4-Zone Water Timer"
+    SUPPORTS_ZONES = 4
 
     def __init__(self, hub_device_name=None, hub_product_key=None, **kwargs):
         super().__init__(**kwargs)
-        self.zones = {i: {"active": False, "status": "off"} for i in [1, 2, 3, 4]}
+        # Zone state indexed directly by zone number (index 0 unused)
+        self._zone_active = bytearray(5)
+        self._zone_status = ['off'] * 5
         self.hub_device_name = hub_device_name
         self.hub_product_key = hub_product_key
         self.hw_sequence = "000000"
 
     def _parse_device_specific_status_d_value(self, s):
-        if not s or '#' not in s: return
-        hex_data = s.split('#')[1]
+        payload = _TIMER_PAYLOAD_RE.match(s)
+        if payload is None: return
+        hex_data = payload.group(1)
         if len(hex_data) >= 8:
             self.hw_sequence = hex_data[2:8]
-            logger.info("[DEBUG] [TIMER UPDATE] %s: HW Sequence %s", self.name, self.hw_sequence)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[TIMER UPDATE] %s: HW Sequence %s", self.name, self.hw_sequence)
         
-        status_map = {'D841': 'on', 'D800': 'off_recent', 'D820': 'off_idle'}
-        p_patterns = ['19D8', '1AD8', '1BD8', '1CD8']
-        for i, pat in enumerate(p_patterns, 1):
-            pos = hex_data.find(pat)
-            if pos >= 0 and pos + 6 <= len(hex_data):
-                st_code = hex_data[pos+2:pos+6]
-                if st_code in status_map:
-                    self.zones[i]['active'] = (status_map[st_code] == 'on')
-                    self.zones[i]['status'] = status_map[st_code]
+        buf = _hex_to_bytes(hex_data)
+        seen = set()
+        # One C-level scan per 0xD8; the zone marker is the byte before it, the status the byte after
+        pos = buf.find(_MARK_ZONE_STATUS, 1)
+        while 0 < pos < len(buf) - 1:
+            i = buf[pos - 1] - _ZONE_MARKER_BASE
+            # Only the first occurrence of each zone marker is authoritative
+            if 1 <= i <= 4 and i not in seen:
+                seen.add(i)
+                mapped = _ZONE_STATUS_MAP.get(buf[pos + 1])
+                if mapped:
+                    self._zone_status[i], self._zone_active[i] = mapped
+                if len(seen) == 4:
+                    # Every zone resolved; the rest of the payload cannot change anything
+                    break
+            pos = buf.find(_MARK_ZONE_STATUS, pos + 1)
+
+    @property
+    def zones(self) -> dict:
+        """Snapshot of all zone states, keyed by zone number."""
+        return {i: {"active": bool(self._zone_active[i]), "status": self._zone_status[i]} for i in range(1, 5)}
 
     def is_zone_active(self, zone_number: int) -> bool:
-        return self.zones.get(zone_number, {}).get('active', False)
+        return bool(self._zone_active[zone_number]) if 1 <= zone_number <= 4 else False
 
     def get_zone_status_text(self, zone_number: int) -> str:
-        return self.zones.get(zone_number, {}).get('status', 'unknown')
+        return self._zone_status[zone_number] if 1 <= zone_number <= 4 else 'unknown'
+
+    def get_zone_state(self, zone_number: int) -> tuple:
+        """Returns the (status text, active flag) pair for a zone, e.g. to roll back an optimistic update."""
+        return self._zone_status[zone_number], bool(self._zone_active[zone_number])
+
+    def set_zone_state(self, zone_number: int, status: str, active: bool) -> None:
+        """Sets a zone's state ahead of the next status packet (optimistic UI updates)."""
+        if 1 <= zone_number <= 4:
+            self._zone_status[zone_number] = status
+            self._zone_active[zone_number] = active
 
     def control_zone(self, api, zone_number: int, mode: int, duration: int = 0) -> bool:
-        return api.control_device_work_mode(self.hub_device_name, self.hub_product_key, str(self.mid), self.address, zone_number, mode, duration)
+        return api.control_device_work_mode(self.hub_device_name, self.hub_product_key, self.mid_str, self.address, zone_number, mode, duration)
 
+@_register_model
 class RainPointDisplayHub(HomgarHubDevice):
     """Environmental Display Hub."""
+    __slots__ = ('temp_c_current', 'hum_current', 'press_pa_current')
     MODEL_CODES = [289]
+    _STATE_ATTRS = HomgarHubDevice._STATE_ATTRS + ('temp_c_current', 'hum_current', 'press_pa_current')
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.temp_mk_current = None
+        self.temp_c_current = None
         self.hum_current = None
         self.press_pa_current = None
-
-    def get_device_status_ids(self):
-        return ["connected", "state", "D01"]
+        self._status_ids = ("connected", "state", "D01")
 
     def _parse_device_specific_status_d_value(self, s):
         parts = s.split(',')
         if len(parts) >= 3:
-            t_f, *_ = _parse_stats_value(parts[0])
-            if t_f: self.temp_mk_current = _temp_to_mk(t_f)
-            h, *_ = _parse_stats_value(parts[1])
+            t_f = _parse_stats_first(parts[0])
+            if t_f: self.temp_c_current = _f_tenths_to_c(t_f)
+            h = _parse_stats_first(parts[1])
             if h: self.hum_current = h
-            p, *_ = _parse_stats_value(parts[2])
+            p = _parse_stats_first(parts[2])
             if p: self.press_pa_current = p
-
-MODEL_CODE_MAPPING = {
-    289: RainPointDisplayHub,
-    317: RainPointSoilMoistureSensor,
-    262: RainPointAirSensor,
-    87:  RainPointRainSensor,
-    38:  HTV405FRF
-}
\ No newline at end of file
@@ -12,6 +12,27 @@ from .coordinator import HomgarDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _device_info_for(coordinator: HomgarDataUpdateCoordinator, device: Any) -> DeviceInfo:
+    """Return the DeviceInfo shared by a device's entities, building it on first use.
+
+    The cache lives on the coordinator, so it starts fresh on every config entry (re)load.
+    """
+    cache = coordinator.device_info_cache
+    info = cache.get(device.uid_prefix)
+    if info is None:
+        info = cache[device.uid_prefix] = DeviceInfo(
+            identifiers={
+                (DOMAIN, device.uid_prefix)
+            },
+            name=device.name,
+            manufacturer="HomGar",
+            model=device.model,
+            sw_version=getattr(device, "softVer", None),
+        )
+    return info
+
+
 class HomgarEntity(CoordinatorEntity[HomgarDataUpdateCoordinator]):
     """Base class for HomGar entities."""
 
@@ -24,16 +45,7 @@ class HomgarEntity(CoordinatorEntity[HomgarDataUpdateCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.device_id = device_id
-        
-        self._attr_device_info = DeviceInfo(
-            identifiers={
-                (DOMAIN, f"{device.mid}_{device.address}")
-            },
-            name=device.name,
-            manufacturer="HomGar",
-            model=device.model,
-            sw_version=getattr(device, "softVer", None),
-        )
+        self._attr_device_info = _device_info_for(coordinator, device)
 
     @property
     def device(self) -> Any:
@@ -50,7 +62,7 @@ class HomgarEntity(CoordinatorEntity[HomgarDataUpdateCoordinator]):
         coord_ok = self.coordinator.last_update_success
         device_present = self.device is not None
         
-        if not coord_ok or not device_present:
+        if (not coord_ok or not device_present) and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("[DEBUG] [Entity Availability] ID=%s, Available=False (CoordSuccess=%s, DevicePresent=%s)", 
                           self.device_id, coord_ok, device_present)
             
@@ -64,22 +76,11 @@ class HomgarEntity(CoordinatorEntity[HomgarDataUpdateCoordinator]):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs = {}
-        
-        # Guard against device being None
-        if not self.device:
-            return attrs
-
-        # Add connection state if available
-        if hasattr(self.device, 'connection_state') and self.device.connection_state is not None:
-            attrs["connected"] = self.device.connection_state
-        
-        # Add RSSI if available
-        if hasattr(self.device, 'rf_rssi') and self.device.rf_rssi is not None:
-            attrs["rssi"] = self.device.rf_rssi
-        
-        # Add device state if available
-        if hasattr(self.device, 'device_state') and self.device.device_state is not None:
-            attrs["device_state"] = self.device.device_state
-        
-        return attrs
\ No newline at end of file
+        device = self.device
+        if device is None:
+            return {}
+        return {
+            key: val
+            for key, attr in device.EXTRA_ATTRS
+            if (val := getattr(device, attr, None)) is not None
+        }
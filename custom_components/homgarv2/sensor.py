@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -51,6 +50,7 @@ SENSOR_DESCRIPTIONS = {
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
         icon=ICON_TEMPERATURE,
     ),
     # New Min/Max Temperature Descriptions
@@ -60,6 +60,7 @@ SENSOR_DESCRIPTIONS = {
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
         icon=ICON_TEMPERATURE,
     ),
     "temp_max": SensorEntityDescription(
@@ -68,6 +69,7 @@ SENSOR_DESCRIPTIONS = {
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
         icon=ICON_TEMPERATURE,
     ),
     "humidity": SensorEntityDescription(
@@ -150,6 +152,60 @@ SENSOR_DESCRIPTIONS = {
     ),
 }
 
+# Description key -> device attribute read by native_value, resolved once per entity
+_AIR_TEMP_ATTRS = {"temperature": "temp_c_current", "temp_min": "temp_c_min", "temp_max": "temp_c_max"}
+_AIR_HUM_ATTRS = {"humidity": "hum_current", "hum_min": "hum_min", "hum_max": "hum_max"}
+_RAINFALL_ATTRS = {
+    "rainfall_current": "rain_hour",  # Mapping internal 1h to 'Current'
+    "rainfall_24h": "rain_24h",
+    "rainfall_7d": "rain_7d",
+    "rainfall_total": "rain_total",
+}
+
+
+def _build_display_hub_sensors(coordinator, device_id, device) -> list:
+    """Build display hub sensors, only for readings the hub actually reports."""
+    entities = []
+    if getattr(device, "temp_c_current", None) is not None:
+        entities.append(HomgarTemperatureSensor(coordinator, device_id, device))
+    if getattr(device, "hum_current", None) is not None:
+        entities.append(HomgarHumiditySensor(coordinator, device_id, device))
+    if getattr(device, "press_pa_current", None) is not None:
+        entities.append(HomgarPressureSensor(coordinator, device_id, device))
+    return entities
+
+
+def _build_soil_sensors(coordinator, device_id, device) -> list:
+    """Build the soil moisture sensor."""
+    return [HomgarSoilMoistureSensor(coordinator, device_id, device)]
+
+
+def _build_air_sensors(coordinator, device_id, device) -> list:
+    """Build current/min/max temperature and humidity sensors for an air sensor."""
+    return [
+        # Temperature Entities (Current, Min, Max)
+        HomgarAirTemperatureSensor(coordinator, device_id, device),
+        HomgarAirTemperatureSensor(coordinator, device_id, device, "temp_min"),
+        HomgarAirTemperatureSensor(coordinator, device_id, device, "temp_max"),
+        # Humidity Entities (Current, Min, Max)
+        HomgarAirHumiditySensor(coordinator, device_id, device),
+        HomgarAirHumiditySensor(coordinator, device_id, device, "hum_min"),
+        HomgarAirHumiditySensor(coordinator, device_id, device, "hum_max"),
+    ]
+
+
+def _build_rain_sensors(coordinator, device_id, device) -> list:
+    """Build the rainfall sensors for each reported period."""
+    return [
+        HomgarRainfallSensor(coordinator, device_id, device, key)
+        for key in ("rainfall_current", "rainfall_24h", "rainfall_7d", "rainfall_total")
+    ]
+
+
+def _build_timer_sensors(coordinator, device_id, device) -> list:
+    """Build one status sensor per irrigation zone."""
+    return [HomgarZoneStatusSensor(coordinator, device_id, device, zone) for zone in (1, 2, 3, 4)]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -163,45 +219,9 @@ async def async_setup_entry(
     entities = []
 
     for device_id, device in coordinator.devices.items():
-        if isinstance(device, RainPointDisplayHub):
-            # Only add sensors if the specific data exists on the device
-            if getattr(device, "temp_mk_current", None) is not None:
-                entities.append(HomgarTemperatureSensor(coordinator, device_id, device))
-            
-            if getattr(device, "hum_current", None) is not None:
-                entities.append(HomgarHumiditySensor(coordinator, device_id, device))
-                
-            if getattr(device, "press_pa_current", None) is not None:
-                entities.append(HomgarPressureSensor(coordinator, device_id, device))
-
-        elif isinstance(device, RainPointSoilMoistureSensor):
-            entities.append(
-                HomgarSoilMoistureSensor(coordinator, device_id, device)
-            )
-        elif isinstance(device, RainPointAirSensor):
-            entities.extend([
-                # Temperature Entities (Current, Min, Max)
-                HomgarAirTemperatureSensor(coordinator, device_id, device),
-                HomgarAirTemperatureSensor(coordinator, device_id, device, "temp_min"),
-                HomgarAirTemperatureSensor(coordinator, device_id, device, "temp_max"),
-                
-                # Humidity Entities (Current, Min, Max)
-                HomgarAirHumiditySensor(coordinator, device_id, device),
-                HomgarAirHumiditySensor(coordinator, device_id, device, "hum_min"),
-                HomgarAirHumiditySensor(coordinator, device_id, device, "hum_max"),
-            ])
-        elif isinstance(device, RainPointRainSensor):
-            entities.extend([
-                HomgarRainfallSensor(coordinator, device_id, device, "rainfall_current"),
-                HomgarRainfallSensor(coordinator, device_id, device, "rainfall_24h"),
-                HomgarRainfallSensor(coordinator, device_id, device, "rainfall_7d"),
-                HomgarRainfallSensor(coordinator, device_id, device, "rainfall_total"),
-            ])
-        elif isinstance(device, HTV405FRF):
-            for zone in [1, 2, 3, 4]:
-                entities.append(
-                    HomgarZoneStatusSensor(coordinator, device_id, device, zone)
-                )
+        builder = _SENSOR_BUILDERS.get(type(device))
+        if builder:
+            entities.extend(builder(coordinator, device_id, device))
 
     _LOGGER.info("[DEBUG] [Sensor Setup] Adding %d sensor entities to HA", len(entities))
     async_add_entities(entities)
@@ -225,10 +245,10 @@ class HomgarSensor(HomgarEntity, SensorEntity):
         
         if zone is not None:
             self._attr_name = f"{device.name} Zone {zone} {description.name}"
-            self._attr_unique_id = f"{device.mid}_{device.address}_zone_{zone}_{description.key}"
+            self._attr_unique_id = f"{device.uid_prefix}_zone_{zone}_{description.key}"
         else:
             self._attr_name = f"{device.name} {description.name}"
-            self._attr_unique_id = f"{device.mid}_{device.address}_{description.key}"
+            self._attr_unique_id = f"{device.uid_prefix}_{description.key}"
 
 
 class HomgarTemperatureSensor(HomgarSensor):
@@ -238,9 +258,8 @@ class HomgarTemperatureSensor(HomgarSensor):
 
     @property
     def native_value(self) -> float | None:
-        if self.device and hasattr(self.device, 'temp_mk_current') and self.device.temp_mk_current:
-            return round(self.device.temp_mk_current * 1e-3 - 273.15, 1)
-        return None
+        # Rounding is left to suggested_display_precision
+        return getattr(self.device, 'temp_c_current', None)
 
 
 class HomgarHumiditySensor(HomgarSensor):
@@ -276,71 +295,38 @@ class HomgarSoilMoistureSensor(HomgarSensor):
 class HomgarAirTemperatureSensor(HomgarSensor):
     """Air temperature sensor supporting Current, Min, and Max."""
     def __init__(self, coordinator, device_id, device, description_key="temperature"):
-        # Use the specific description for Min/Max or default to current
-        desc = SENSOR_DESCRIPTIONS.get(description_key, SENSOR_DESCRIPTIONS["temperature"])
-        # Apply the Air Sensor icon fix
-        new_desc = replace(desc, icon=ICON_AIR_SENSOR)
-        super().__init__(coordinator, device_id, device, new_desc)
-        self._desc_key = description_key
+        # Use the specific description for Min/Max or current
+        super().__init__(coordinator, device_id, device, SENSOR_DESCRIPTIONS[description_key])
+        # Air Sensor icon fix; the entity-level icon overrides the shared description's
+        self._attr_icon = ICON_AIR_SENSOR
+        self._src_attr = _AIR_TEMP_ATTRS[description_key]
 
     @property
     def native_value(self) -> float | None:
-        if not self.device:
-            return None
-            
-        # Map the description key to the correct internal variable
-        attr = 'temp_mk_current'
-        if self._desc_key == "temp_min":
-            attr = 'temp_mk_min'
-        elif self._desc_key == "temp_max":
-            attr = 'temp_mk_max'
-        
-        val = getattr(self.device, attr, None)
-        if val is not None:
-            # Convert milli-Kelvin to Celsius rounded to 1 decimal
-            return round(val * 1e-3 - 273.15, 1)
-        return None
+        return getattr(self.device, self._src_attr, None)
 
 
 class HomgarAirHumiditySensor(HomgarSensor):
     """Air humidity sensor supporting Current, Min, and Max."""
     def __init__(self, coordinator, device_id, device, description_key="humidity"):
-        desc = SENSOR_DESCRIPTIONS.get(description_key, SENSOR_DESCRIPTIONS["humidity"])
-        new_desc = replace(desc, icon=ICON_AIR_SENSOR)
-        super().__init__(coordinator, device_id, device, new_desc)
-        self._desc_key = description_key
+        super().__init__(coordinator, device_id, device, SENSOR_DESCRIPTIONS[description_key])
+        self._attr_icon = ICON_AIR_SENSOR
+        self._src_attr = _AIR_HUM_ATTRS[description_key]
 
     @property
     def native_value(self) -> int | None:
-        if not self.device:
-            return None
-            
-        attr = 'hum_current'
-        if self._desc_key == "hum_min":
-            attr = 'hum_min'
-        elif self._desc_key == "hum_max":
-            attr = 'hum_max'
-            
-        return getattr(self.device, attr, None)
+        return getattr(self.device, self._src_attr, None)
 
 
 class HomgarRainfallSensor(HomgarSensor):
     """Rainfall sensor supporting Current, 24h, 7d, and Total."""
     def __init__(self, coordinator, device_id, device, description_key):
         super().__init__(coordinator, device_id, device, SENSOR_DESCRIPTIONS[description_key])
-        self._desc_key = description_key
+        self._src_attr = _RAINFALL_ATTRS[description_key]
 
     @property
     def native_value(self) -> float | None:
-        if self._desc_key == "rainfall_current":
-            return getattr(self.device, 'rain_current', 0.0) # Mapping internal 1h to 'Current'
-        if self._desc_key == "rainfall_24h":
-            return getattr(self.device, 'rain_24h', 0.0)
-        if self._desc_key == "rainfall_7d":
-            return getattr(self.device, 'rain_7d', 0.0)
-        if self._desc_key == "rainfall_total":
-            return getattr(self.device, 'rain_total', 0.0)
-        return None
+        return getattr(self.device, self._src_attr, 0.0)
 
 
 class HomgarZoneStatusSensor(HomgarSensor):
@@ -350,6 +336,16 @@ class HomgarZoneStatusSensor(HomgarSensor):
 
     @property
     def native_value(self) -> str | None:
-        if self.device and hasattr(self.device, 'get_zone_status_text'):
-            return self.device.get_zone_status_text(self.zone)
-        return None
\ No newline at end of file
+        # Only HTV405FRF devices get zone status sensors, so the method is always there
+        device = self.device
+        return device.get_zone_status_text(self.zone) if device is not None else None
+
+
+# Device class -> entity factory, looked up by exact type during setup
+_SENSOR_BUILDERS = {
+    RainPointDisplayHub: _build_display_hub_sensors,
+    RainPointSoilMoistureSensor: _build_soil_sensors,
+    RainPointAirSensor: _build_air_sensors,
+    RainPointRainSensor: _build_rain_sensors,
+    HTV405FRF: _build_timer_sensors,
+}
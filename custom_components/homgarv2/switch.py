@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -11,11 +12,16 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import HomgarConfigEntry
 from .const import ICON_IRRIGATION_ZONE
 from .coordinator import HomgarDataUpdateCoordinator
-from .devices import HTV405FRF
+from .devices import MODEL_CODE_MAPPING
 from .entity import HomgarEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Per-zone name/unique-id suffixes, built once instead of formatted per entity
+_ZONE_RANGE = range(1, max(cls.SUPPORTS_ZONES for cls in MODEL_CODE_MAPPING.values()) + 1)
+_ZONE_NAME_SUFFIXES = {zone: f" Zone {zone}" for zone in _ZONE_RANGE}
+_ZONE_UID_SUFFIXES = {zone: f"_zone_{zone}_switch" for zone in _ZONE_RANGE}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,16 +32,12 @@ async def async_setup_entry(
     coordinator = config_entry.runtime_data
     _LOGGER.info("[DEBUG] [Switch Setup] Initializing switch entities for %d devices", len(coordinator.devices))
 
-    entities = []
-
     # Create switches for each zone of supported devices
-    for device_id, device in coordinator.devices.items():
-        if isinstance(device, HTV405FRF):
-            # HTV405FRF is a 4-zone timer
-            for zone in [1, 2, 3, 4]:
-                entities.append(
-                    HomgarZoneSwitch(coordinator, device_id, device, zone)
-                )
+    entities = [
+        HomgarZoneSwitch(coordinator, device_id, device, zone)
+        for device_id, device in coordinator.devices.items()
+        for zone in range(1, device.SUPPORTS_ZONES + 1)
+    ]
 
     _LOGGER.info("[DEBUG] [Switch Setup] Adding %d switch entities to Home Assistant", len(entities))
     async_add_entities(entities)
@@ -44,6 +46,9 @@ async def async_setup_entry(
 class HomgarZoneSwitch(HomgarEntity, SwitchEntity):
     """Representation of a HomGar irrigation zone switch."""
 
+    # HA's base entities keep a __dict__, but the field read in is_on becomes a slot read
+    __slots__ = ("zone",)
+
     def __init__(
         self,
         coordinator: HomgarDataUpdateCoordinator,
@@ -54,38 +59,57 @@ class HomgarZoneSwitch(HomgarEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator, device_id, device)
         self.zone = zone
-        self._attr_name = f"{device.name} Zone {zone}"
-        self._attr_unique_id = f"{device.mid}_{device.address}_zone_{zone}_switch"
+        self._attr_name = device.name + _ZONE_NAME_SUFFIXES[zone]
+        # Interned: the entity registry keys on it
+        self._attr_unique_id = sys.intern(device.uid_prefix + _ZONE_UID_SUFFIXES[zone])
         self._attr_icon = ICON_IRRIGATION_ZONE
 
     @property
     def is_on(self) -> bool:
         """Return True if the zone is currently active (watering)."""
-        # DEBUG: Log the exact check from the HA UI
-        # This confirms if the dashboard is correctly reading the internal 'active' flag.
-        latest_device_data = self.coordinator.data.get(self.device_id)
-
-        if latest_device_data and hasattr(latest_device_data, 'is_zone_active'):
-            state = latest_device_data.is_zone_active(self.zone)
-            _LOGGER.info("[DEBUG] [Switch UI Check] Device: %s | Zone: %d | is_on: %s", 
-                         self.device_id, self.zone, state)
-            return state
-        
-        return False
+        # Read on every state write and template render, so deliberately not logged
+        # Switches are only built for zone timers, so a present device always has is_zone_active
+        device = self.coordinator.data.get(self.device_id)
+        return device.is_zone_active(self.zone) if device is not None else False
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the zone on via the coordinator."""
         # Default duration if not specified by a service call
         duration = kwargs.get("duration", 600)
         
-        _LOGGER.info("[DEBUG] [Switch Action] UI Turning ON: %s | Zone: %d | Duration: %ss", 
-                     self.device_id, self.zone, duration)
+        _LOGGER.debug("[Switch Action] UI Turning ON: %s | Zone: %d | Duration: %ss",
+                      self.device_id, self.zone, duration)
         
-        await self.coordinator.async_control_zone(self.device_id, self.zone, 1, duration)
+        await self._async_control(True, 1, duration)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the zone off via the coordinator."""
-        _LOGGER.info("[DEBUG] [Switch Action] UI Turning OFF: %s | Zone: %d", 
-                     self.device_id, self.zone)
+        _LOGGER.debug("[Switch Action] UI Turning OFF: %s | Zone: %d",
+                      self.device_id, self.zone)
         
-        await self.coordinator.async_control_zone(self.device_id, self.zone, 0, 0)
\ No newline at end of file
+        await self._async_control(False, 0, 0)
+
+    async def _async_control(self, active: bool, mode: int, duration: int) -> None:
+        """Reflect the requested state immediately and send the command in the background."""
+        device = self.device
+        previous = None
+        if device is not None:
+            previous = device.get_zone_state(self.zone)
+            device.set_zone_state(self.zone, "on" if active else "off_recent", active)
+            # Notify every listener so the zone status sensor reading the same device updates too
+            self.coordinator.async_update_listeners()
+
+        # Return to the service caller right away; the cloud round-trip runs as a task
+        self.hass.async_create_task(
+            self._async_send_control(device, previous, mode, duration),
+            name=f"homgar_zone_{self.device_id}_{self.zone}",
+        )
+
+    async def _async_send_control(self, device: Any, previous: tuple | None, mode: int, duration: int) -> None:
+        """Send the zone command; roll the optimistic state back if it could not be sent."""
+        # async_control_zone returns False only when the command could not be sent
+        sent = await self.coordinator.async_control_zone(self.device_id, self.zone, mode, duration)
+
+        if sent is False and previous is not None:
+            device.set_zone_state(self.zone, *previous)
+            self.coordinator.async_update_listeners()